@@ -6,18 +6,40 @@ Gera comentários realistas para serem processados em uma arquitetura Pipes and
 
 import json
 import csv
+import os
 import random
 import argparse
-from typing import List, Dict, Any
+import operator
+import multiprocessing
+from typing import Iterable, Iterator, List, Dict, Any
 from pathlib import Path
+import numpy as np
 from faker import Faker
 
+# orjson é opcional: serializa direto para bytes UTF-8, muito mais rápido
+# que o json da biblioteca padrão para datasets grandes
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Literais de sentimento indexados por booleano: evita a expressão
+# condicional dentro do loop quente de montagem dos dicionários
+_SENTIMENT = ("negative", "positive")
+
 
 class SocialCommentGenerator:
     """Gerador de comentários simulados para redes sociais."""
     
-    def __init__(self):
-        """Inicializa o gerador com dados pré-definidos."""
+    def __init__(self, seed: int = None):
+        """
+        Inicializa o gerador com dados pré-definidos.
+
+        Args:
+            seed: Semente opcional para geração reproduzível
+        """
+        if seed is not None:
+            Faker.seed(seed)
         self.faker = Faker(['pt_BR', 'en_US', 'es_ES', 'fr_FR', 'de_DE'])
         
         self.countries = [
@@ -49,25 +71,61 @@ class SocialCommentGenerator:
             "Egito": ["Cairo", "Alexandria", "Giza", "Shubra El Kheima", "Port Said"],
             "Nigéria": ["Lagos", "Kano", "Ibadan", "Kaduna", "Port Harcourt"]
         }
-    
+
+        # Tabela achatada de estados, paralela a self.countries: evita o
+        # hash do dict e a lista intermediária a cada comentário
+        self._all_states: List[str] = []
+        state_offsets = []
+        state_counts = []
+        for country in self.countries:
+            states = self.states.get(country, ["Capital"])
+            state_offsets.append(len(self._all_states))
+            state_counts.append(len(states))
+            self._all_states.extend(states)
+        self._state_offsets = np.array(state_offsets)
+        self._state_counts = np.array(state_counts)
+
+        # Pools de nomes e textos gerados em lote pelo Faker.
+        # O despacho multi-locale do Faker tem custo alto por chamada;
+        # gerar em lote e sortear do pool amortiza esse custo.
+        self._pool_size = 1000
+        self._name_pool: List[str] = []
+        self._text_pool: List[str] = []
+
+        # RNGs dedicados (semeados uma única vez): evitam os singletons
+        # globais e tornam a geração reproduzível quando há semente
+        self._rng = random.Random(seed)
+        self._np_rng = np.random.default_rng(seed)
+
+        # Contadores acumulados durante a geração (evita re-escanear o
+        # dataset depois só para calcular estatísticas)
+        self.stats = {"total": 0, "positive": 0}
+
+    def _refill_pools(self):
+        """Preenche os pools de nomes e textos em um único lote."""
+        self._name_pool = [self.faker.name() for _ in range(self._pool_size)]
+        self._text_pool = [self.faker.paragraph() for _ in range(self._pool_size)]
+
     def generate_comment(self, post_id: str) -> Dict[str, Any]:
         """Gera um comentário individual."""
+        # Métodos do RNG ligados a locais: corta o lookup de atributos
+        _choice = self._rng.choice
+
         # Escolhe país e estado
-        country = random.choice(self.countries)
-        state = random.choice(self.states.get(country, ["Capital"]))
-        
-        # Gera nome usando Faker
-        user = self.faker.name()
-        
+        country = _choice(self.countries)
+        state = _choice(self.states.get(country, ["Capital"]))
+
+        # Sorteia nome e texto dos pools pré-gerados pelo Faker
+        if not self._name_pool:
+            self._refill_pools()
+        user = _choice(self._name_pool)
+        text = _choice(self._text_pool)
+
         # Determina sentimento (70% positivo, 30% negativo)
-        is_positive = random.random() < 0.7
-        
-        # Gera texto do comentário
-        text = self.faker.paragraph()
-        sentiment = "positive" if is_positive else "negative"
-        
+        sentiment = _SENTIMENT[self._rng.random() < 0.7]
+
         # Gera likes (0-200)
-        likes = random.randint(0, 200)
+        likes = self._rng.randint(0, 200)
         
         return {
             "post_id": post_id,
@@ -79,53 +137,227 @@ class SocialCommentGenerator:
             "sentiment": sentiment
         }
     
+    # Tamanho do lote de sorteios vetorizados com NumPy
+    _BATCH_SIZE = 10_000
+
+    def iter_comments(self, num_comments: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Gera comentários sob demanda, em lotes vetorizados.
+
+        Os sorteios aleatórios (país, likes, sentimento, nome, texto) são
+        feitos em lote com NumPy — poucas chamadas em C em vez de várias
+        chamadas Python por comentário.
+        """
+        if not self._name_pool:
+            self._refill_pools()
+
+        rng = self._np_rng
+        produced = 0
+        self.stats = {"total": 0, "positive": 0}
+
+        while produced < num_comments:
+            n = min(self._BATCH_SIZE, num_comments - produced)
+
+            # Sorteios em lote (4 chamadas C no lugar de 4*n chamadas Python)
+            country_idx = rng.integers(0, len(self.countries), size=n)
+            likes = rng.integers(0, 201, size=n)
+            pos_idx = (rng.random(n) < 0.7).view(np.int8)
+            name_idx = rng.integers(0, len(self._name_pool), size=n)
+            text_idx = rng.integers(0, len(self._text_pool), size=n)
+
+            # Seleção de estado via tabela achatada (também em lote)
+            state_idx = self._state_offsets[country_idx] + \
+                rng.integers(0, self._state_counts[country_idx])
+
+            self.stats["total"] += n
+            self.stats["positive"] += int(pos_idx.sum())
+
+            # .tolist() converte os lotes para int/str nativos em uma única
+            # chamada C, evitando o boxing de escalares NumPy por elemento;
+            # as sequências viram locais para cortar lookups de atributo
+            countries = self.countries
+            all_states = self._all_states
+            name_pool = self._name_pool
+            text_pool = self._text_pool
+
+            # post_ids pré-formatados em uma list comprehension dedicada,
+            # fora do loop de montagem dos dicionários
+            post_ids = [f"post_{i:04d}"
+                        for i in range(produced + 1, produced + n + 1)]
+
+            rows = zip(post_ids, country_idx.tolist(), state_idx.tolist(),
+                       likes.tolist(), name_idx.tolist(),
+                       text_idx.tolist(), pos_idx.tolist())
+
+            for pid, ci, si, lk, ni, ti, pi in rows:
+                yield {
+                    "post_id": pid,
+                    "user": name_pool[ni],
+                    "country": countries[ci],
+                    "state": all_states[si],
+                    "likes": lk,
+                    "text": text_pool[ti],
+                    "sentiment": _SENTIMENT[pi]
+                }
+
+            produced += n
+
     def generate_dataset(self, num_comments: int = 100) -> List[Dict[str, Any]]:
-        """Gera o dataset completo de comentários."""
-        comments = []
-        
-        for i in range(num_comments):
-            post_id = f"post_{i+1:04d}"
-            comment = self.generate_comment(post_id)
-            comments.append(comment)
-        
+        """Gera o dataset completo de comentários como lista."""
+        return list(self.iter_comments(num_comments))
+
+    def generate_dataset_parallel(self, num_comments: int = 100,
+                                  workers: int = None) -> List[Dict[str, Any]]:
+        """
+        Gera o dataset em paralelo, dividindo a carga entre processos.
+
+        Cada comentário é independente, então a geração é dividida em
+        faixas contíguas processadas por um Pool de workers.
+
+        Args:
+            num_comments: Número total de comentários a gerar
+            workers: Número de processos (padrão: número de CPUs)
+
+        Returns:
+            Lista com os comentários gerados
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or num_comments < workers:
+            return self.generate_dataset(num_comments)
+
+        # Divide em faixas contíguas (start, count) para preservar os post_ids
+        base, extra = divmod(num_comments, workers)
+        ranges = []
+        start = 0
+        for w in range(workers):
+            count = base + (1 if w < extra else 0)
+            ranges.append((start, count))
+            start += count
+
+        comments: List[Dict[str, Any]] = []
+        with multiprocessing.Pool(workers, initializer=_init_worker) as pool:
+            for part in pool.imap(_generate_chunk, ranges):
+                comments.extend(part)
+
+        self.stats = {
+            "total": len(comments),
+            "positive": sum(1 for c in comments if c['sentiment'] == 'positive')
+        }
         return comments
-    
-    def save_json(self, comments: List[Dict[str, Any]], filename: str):
-        """Salva os comentários em formato JSON."""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(comments, f, ensure_ascii=False, indent=2)
+
+    def save_json(self, comments: Iterable[Dict[str, Any]], filename: str):
+        """Salva os comentários em formato JSON (escrita incremental)."""
+        if orjson is not None:
+            # orjson emite bytes UTF-8 diretamente, sem passar por str
+            with open(filename, 'wb') as f:
+                f.write(b'[')
+                for i, comment in enumerate(comments):
+                    if i:
+                        f.write(b',')
+                    f.write(orjson.dumps(comment))
+                f.write(b']')
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write('[')
+                for i, comment in enumerate(comments):
+                    if i:
+                        f.write(',')
+                    json.dump(comment, f, ensure_ascii=False)
+                f.write(']')
         print(f"✅ Dataset salvo em JSON: {filename}")
-    
-    def save_csv(self, comments: List[Dict[str, Any]], filename: str):
-        """Salva os comentários em formato CSV."""
-        if not comments:
+
+    def save_csv(self, comments: Iterable[Dict[str, Any]], filename: str):
+        """Salva os comentários em formato CSV (escrita incremental)."""
+        comments = iter(comments)
+        try:
+            first = next(comments)
+        except StopIteration:
             return
-        
-        fieldnames = comments[0].keys()
+
+        # Todos os comentários compartilham a mesma ordem de chaves, então
+        # csv.writer + itemgetter evita o rearranjo por chave do DictWriter
+        fieldnames = list(first.keys())
+        get_row = operator.itemgetter(*fieldnames)
         with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(comments)
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerow(get_row(first))
+            writer.writerows(map(get_row, comments))
         print(f"✅ Dataset salvo em CSV: {filename}")
     
-    def save_txt(self, comments: List[Dict[str, Any]], filename: str):
-        """Salva os comentários em formato TXT (um por linha)."""
-        with open(filename, 'w', encoding='utf-8') as f:
+    def save_msgpack(self, comments: Iterable[Dict[str, Any]], filename: str):
+        """Salva os comentários em formato MessagePack (binário compacto)."""
+        try:
+            import msgpack
+        except ImportError:
+            print("❌ msgpack não instalado. Execute: pip install msgpack")
+            return
+
+        packer = msgpack.Packer()
+        with open(filename, 'wb') as f:
             for comment in comments:
-                f.write(f"{comment['post_id']} | {comment['user']} | {comment['country']} | {comment['text']}\n")
+                f.write(packer.pack(comment))
+        print(f"✅ Dataset salvo em MessagePack: {filename}")
+
+    def save_parquet(self, comments: Iterable[Dict[str, Any]], filename: str):
+        """Salva os comentários em formato Parquet (colunar, ideal para ETL)."""
+        try:
+            import pandas as pd
+            pd.DataFrame(list(comments)).to_parquet(filename)
+        except ImportError:
+            print("❌ pyarrow não instalado. Execute: pip install pyarrow")
+            return
+        print(f"✅ Dataset salvo em Parquet: {filename}")
+
+    def save_txt(self, comments: Iterable[Dict[str, Any]], filename: str):
+        """Salva os comentários em formato TXT (um por linha)."""
+        # Buffer de 1 MiB + writelines: menos travessias Python->C por linha
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(
+                f"{c['post_id']} | {c['user']} | {c['country']} | {c['text']}\n"
+                for c in comments
+            )
         print(f"✅ Dataset salvo em TXT: {filename}")
 
 
+# Gerador por processo worker, criado uma única vez no initializer do Pool
+_worker_generator = None
+
+
+def _init_worker():
+    """Inicializa o gerador do worker com semente própria por processo."""
+    global _worker_generator
+    random.seed(os.getpid())
+    Faker.seed(os.getpid())
+    _worker_generator = SocialCommentGenerator()
+
+
+def _generate_chunk(chunk_range) -> List[Dict[str, Any]]:
+    """Gera uma faixa contígua de comentários em um processo worker."""
+    start, count = chunk_range
+    comments = list(_worker_generator.iter_comments(count))
+    # Renumera os post_ids para a posição global da faixa
+    for i, comment in enumerate(comments):
+        comment['post_id'] = f"post_{start + i + 1:04d}"
+    return comments
+
+
 def main():
     """Função principal do gerador."""
     parser = argparse.ArgumentParser(description="Gerador de comentários simulados para redes sociais")
     parser.add_argument("-n", "--num-comments", type=int, default=100, 
                        help="Número de comentários a gerar (padrão: 100)")
-    parser.add_argument("-f", "--format", choices=["json", "csv", "txt"], default="json",
+    parser.add_argument("-f", "--format",
+                       choices=["json", "csv", "txt", "msgpack", "parquet"],
+                       default="json",
                        help="Formato de saída (padrão: json)")
     parser.add_argument("-o", "--output", type=str, default="comments_dataset",
                        help="Nome base do arquivo de saída (sem extensão)")
-    
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                       help="Número de processos para geração paralela (padrão: 1)")
+    parser.add_argument("-s", "--seed", type=int, default=None,
+                       help="Semente para geração reproduzível (padrão: aleatória)")
+
     args = parser.parse_args()
     
     print("🚀 Gerador de Comentários Simulados para Redes Sociais")
@@ -136,34 +368,43 @@ def main():
     print()
     
     # Cria o gerador
-    generator = SocialCommentGenerator()
-    
-    # Gera o dataset
-    comments = generator.generate_dataset(args.num_comments)
-    
-    # Estatísticas
-    positive_count = sum(1 for c in comments if c['sentiment'] == 'positive')
-    negative_count = len(comments) - positive_count
-    
-    print("📈 Estatísticas do Dataset:")
-    print(f"   Total de comentários: {len(comments)}")
-    print(f"   Comentários positivos: {positive_count} ({positive_count/len(comments)*100:.1f}%)")
-    print(f"   Comentários negativos: {negative_count} ({negative_count/len(comments)*100:.1f}%)")
-    print()
-    
-    # Salva no formato escolhido
+    generator = SocialCommentGenerator(seed=args.seed)
+
+    # Gera e salva em um único passo (streaming, sem materializar a lista);
+    # com múltiplos workers a geração é paralelizada entre processos
+    if args.workers > 1:
+        comments = generator.generate_dataset_parallel(args.num_comments, args.workers)
+    else:
+        comments = generator.iter_comments(args.num_comments)
     filename = f"{args.output}.{args.format}"
-    
+
     if args.format == "json":
         generator.save_json(comments, filename)
     elif args.format == "csv":
         generator.save_csv(comments, filename)
     elif args.format == "txt":
         generator.save_txt(comments, filename)
-    
+    elif args.format == "msgpack":
+        generator.save_msgpack(comments, filename)
+    elif args.format == "parquet":
+        generator.save_parquet(comments, filename)
+
+    # Estatísticas acumuladas durante a geração (um único passo sobre os dados)
+    total = generator.stats["total"]
+    if total == 0:
+        # Nada foi gerado (ex.: dependência opcional do formato ausente)
+        return
+    positive_count = generator.stats["positive"]
+    negative_count = total - positive_count
+
+    print("\n📈 Estatísticas do Dataset:")
+    print(f"   Total de comentários: {total}")
+    print(f"   Comentários positivos: {positive_count} ({positive_count/total*100:.1f}%)")
+    print(f"   Comentários negativos: {negative_count} ({negative_count/total*100:.1f}%)")
+
     print(f"\n🎉 Dataset gerado com sucesso!")
     print(f"📁 Arquivo: {filename}")
-    print(f"📊 Total de comentários: {len(comments)}")
+    print(f"📊 Total de comentários: {total}")
 
 
 if __name__ == "__main__":
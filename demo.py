@@ -3,14 +3,31 @@
 Demonstração completa do projeto Pipes and Filters para análise de comentários sociais.
 """
 
+import heapq
 import json
 import sys
 import os
+from collections import Counter, defaultdict
 from pathlib import Path
 
 # Adiciona o diretório src ao path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+# orjson é opcional: decodifica bytes UTF-8 direto, bem mais rápido que
+# o json da biblioteca padrão para datasets grandes
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_comments(dataset_path: Path):
+    """Carrega o dataset de comentários, usando orjson quando disponível."""
+    raw = dataset_path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 def main():
     """Demonstração principal do projeto."""
@@ -27,8 +44,7 @@ def main():
     
     # Carrega comentários
     try:
-        with open(dataset_path, 'r', encoding='utf-8') as f:
-            comments = json.load(f)
+        comments = load_comments(dataset_path)
         print(f"✅ Dataset carregado: {len(comments)} comentários")
     except Exception as e:
         print(f"❌ Erro ao carregar dataset: {e}")
@@ -45,8 +61,6 @@ def main():
             create_sentiment_analysis_pipeline,
             create_spam_detection_pipeline,
             create_engagement_analysis_pipeline,
-            create_multilingual_pipeline,
-            create_geographic_pipeline,
             create_comprehensive_social_pipeline
         )
         print("✅ Pipelines importados com sucesso")
@@ -131,7 +145,9 @@ def main():
     print(f"📊 Comentários com engajamento (likes >= 10): {len(engagement_result)}")
     
     if engagement_result:
-        top_engagement = sorted(engagement_result, key=lambda x: x.get('engagement_score', 0), reverse=True)[:3]
+        # heapq.nlargest evita ordenar a lista inteira só para pegar o top 3
+        top_engagement = heapq.nlargest(3, engagement_result,
+                                        key=lambda x: x.get('engagement_score', 0))
         print("🏆 Top 3 comentários por engajamento:")
         for i, comment in enumerate(top_engagement):
             score = comment.get('engagement_score', 0)
@@ -145,11 +161,15 @@ def main():
     print("5️⃣ ANÁLISE MULTILINGUE")
     print("-" * 50)
     
+    # A limpeza de texto é compartilhada pelas análises 5 e 6: executa uma
+    # única vez em vez de reconstruir o pipeline por idioma/país
+    from filters.social_filters import clean_text, filter_by_language
+    cleaned_comments = list(clean_text(iter(comments)))
+
     languages = ["portuguese", "english", "spanish", "french", "german"]
     
     for language in languages:
-        lang_pipeline = create_multilingual_pipeline([language])
-        lang_result = lang_pipeline.execute(iter(comments))
+        lang_result = list(filter_by_language(iter(cleaned_comments), language))
         
         if lang_result:
             print(f"🌐 {language.capitalize()}: {len(lang_result)} comentários")
@@ -162,9 +182,13 @@ def main():
     
     target_countries = ["Brasil", "Estados Unidos", "França", "Alemanha"]
     
+    # Agrupa por país em uma única passada em vez de re-filtrar por país
+    comments_by_country = defaultdict(list)
+    for comment in cleaned_comments:
+        comments_by_country[comment.get('country')].append(comment)
+
     for country in target_countries:
-        geo_pipeline = create_geographic_pipeline([country])
-        geo_result = geo_pipeline.execute(iter(comments))
+        geo_result = comments_by_country.get(country, [])
         
         if geo_result:
             positive_count = sum(1 for c in geo_result if c.get('sentiment') == 'positive')
@@ -183,16 +207,14 @@ def main():
     print(f"📊 Comentários processados pelo pipeline completo: {len(comprehensive_result)}")
     
     if comprehensive_result:
-        # Estatísticas avançadas
-        countries = {}
-        for comment in comprehensive_result:
-            country = comment.get('country', 'Desconhecido')
-            countries[country] = countries.get(country, 0) + 1
-        
+        # Estatísticas avançadas: Counter conta em uma única passada e
+        # most_common usa heap em vez de ordenar tudo
+        countries = Counter(c.get('country', 'Desconhecido')
+                            for c in comprehensive_result)
+
         print(f"🌍 Países representados: {len(countries)}")
-        top_countries = sorted(countries.items(), key=lambda x: x[1], reverse=True)[:5]
         print("   Top 5 países:")
-        for country, count in top_countries:
+        for country, count in countries.most_common(5):
             print(f"     {country}: {count} comentários")
     
     print()
@@ -2,6 +2,8 @@
 Exemplos avançados de uso da arquitetura Pipes and Filters.
 """
 
+import re
+import numpy as np
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -14,6 +16,10 @@ from filters.text_filters import (
     filter_greater_than
 )
 
+# Padrões compilados uma única vez no import, fora do loop dos filtros
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_RE = re.compile(r'^\+?[\d\s\-\(\)]{10,}$')
+
 
 def create_data_validation_pipeline():
     """
@@ -21,20 +27,14 @@ def create_data_validation_pipeline():
     """
     def validate_email(data):
         """Valida se as strings são emails válidos."""
-        import re
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        
         for item in data:
-            if isinstance(item, str) and re.match(email_pattern, item):
+            if isinstance(item, str) and _EMAIL_RE.match(item):
                 yield item
     
     def validate_phone(data):
         """Valida se as strings são números de telefone válidos."""
-        import re
-        phone_pattern = r'^\+?[\d\s\-\(\)]{10,}$'
-        
         for item in data:
-            if isinstance(item, str) and re.match(phone_pattern, item):
+            if isinstance(item, str) and _PHONE_RE.match(item):
                 yield item
     
     return create_custom_pipeline(
@@ -47,65 +47,50 @@ def create_data_validation_pipeline():
 def create_data_transformation_pipeline():
     """
     Cria um pipeline para transformação de dados.
+
+    As quatro etapas (limpar espaços, maiúsculas, prefixo e filtro de
+    comprimento) são fundidas em um único gerador: cada item atravessa
+    um só frame em vez de quatro, com uma única checagem de tipo.
     """
-    def to_uppercase(data):
-        """Converte strings para maiúsculas."""
-        for item in data:
-            if isinstance(item, str):
-                yield item.upper()
-            else:
-                yield item
-    
-    def add_prefix(data, prefix="ITEM_"):
-        """Adiciona um prefixo às strings."""
+    def transform_text(data, prefix="ITEM_", min_length=5):
+        """Limpa espaços, converte para maiúsculas, prefixa e filtra."""
         for item in data:
             if isinstance(item, str):
-                yield f"{prefix}{item}"
-            else:
-                yield item
-    
-    def filter_length(data, min_length=5):
-        """Filtra strings com comprimento mínimo."""
-        for item in data:
-            if isinstance(item, str) and len(item) >= min_length:
-                yield item
-    
-    return create_custom_pipeline(
-        remove_extra_spaces,
-        to_uppercase,
-        add_prefix,
-        filter_length
-    )
+                transformed = f"{prefix}{' '.join(item.split()).upper()}"
+                if len(transformed) >= min_length:
+                    yield transformed
+
+    return create_custom_pipeline(transform_text)
 
 
 def create_conditional_pipeline():
     """
     Cria um pipeline que aplica filtros condicionalmente.
+
+    O trecho numérico é vetorizado: as strings são convertidas de uma
+    vez para um ndarray e os filtros "par" e "positivo" viram uma única
+    máscara booleana, em vez de três geradores item a item.
     """
-    def conditional_filter(data, condition_func):
-        """Aplica um filtro apenas se a condição for verdadeira."""
-        for item in data:
-            if condition_func(item):
-                yield item
-    
-    def is_even_number(data):
-        """Filtra apenas números pares."""
-        for item in data:
-            if isinstance(item, (int, float)) and item % 2 == 0:
-                yield item
-    
-    def is_positive_number(data):
-        """Filtra apenas números positivos."""
-        for item in data:
-            if isinstance(item, (int, float)) and item > 0:
-                yield item
-    
+    def numeric_even_positive(data):
+        """Converte strings numéricas e filtra pares e positivos em lote."""
+        def converted(items):
+            for item in items:
+                if isinstance(item, str) \
+                        and item.replace('-', '').replace('.', '').replace(',', '').isdigit():
+                    # O pré-filtro aceita formas como '12-34' e '1.2.3'
+                    # que float() rejeita; descarta como o pipeline
+                    # original (convert_to_integers) fazia
+                    try:
+                        yield int(float(item.replace(',', '')))
+                    except (ValueError, TypeError):
+                        continue
+
+        arr = np.fromiter(converted(data), dtype=np.int64)
+        yield from arr[(arr > 0) & (arr % 2 == 0)].tolist()
+
     return create_custom_pipeline(
         remove_extra_spaces,
-        filter_numeric_strings,
-        convert_to_integers,
-        is_even_number,
-        is_positive_number
+        numeric_even_positive
     )
 
 
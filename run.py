@@ -10,6 +10,10 @@ import os
 # Adiciona o diretório src ao path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+# --subprocess: roda os testes em um interpretador novo (isolamento de
+# estado de módulos/imports), em vez do caminho padrão no próprio processo
+USE_SUBPROCESS = '--subprocess' in sys.argv
+
 
 def main():
     """Função principal que permite escolher a demonstração."""
@@ -57,14 +61,17 @@ def main():
                 print("Executando todos os testes...")
                 print("="*60 + "\n")
                 
-                import subprocess
-                result = subprocess.run([
-                    sys.executable, '-m', 'unittest', 'discover', 'tests', '-v'
-                ], capture_output=True, text=True)
-                
-                print(result.stdout)
-                if result.stderr:
-                    print("Erros:", result.stderr)
+                # Executa os testes no próprio processo: sem fork/exec de um
+                # novo interpretador e com saída exibida ao vivo. pytest
+                # coleta tanto os testes unittest quanto os em estilo
+                # pytest (fixtures/parametrize de tests/test_pipeline.py)
+                if USE_SUBPROCESS:
+                    import subprocess
+                    subprocess.run([sys.executable, '-m', 'pytest',
+                                    'tests', '-v'])
+                else:
+                    import pytest
+                    pytest.main(['tests', '-v'])
                 
             elif choice == '4':
                 print("\n👋 Obrigado por usar o projeto Pipes and Filters!")
@@ -0,0 +1,89 @@
+"""
+Caminhos quentes compilados com Numba, com fallback vetorizado em NumPy.
+
+Numba é dependência opcional: quando instalado, os loops abaixo são
+compilados para código nativo via LLVM; sem ele, as versões NumPy
+vetorizadas (que já rodam em loops C) entram no lugar com a mesma
+assinatura e o mesmo resultado.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True)
+    def bucket_likes(likes: np.ndarray) -> np.ndarray:
+        """Conta likes por faixa (0-10, 11-50, 51-100, 100+) em loop nativo."""
+        out = np.zeros(4, dtype=np.int64)
+        for value in likes:
+            if value <= 10:
+                out[0] += 1
+            elif value <= 50:
+                out[1] += 1
+            elif value <= 100:
+                out[2] += 1
+            else:
+                out[3] += 1
+        return out
+else:
+    def bucket_likes(likes: np.ndarray) -> np.ndarray:
+        """Conta likes por faixa (0-10, 11-50, 51-100, 100+) vetorizado."""
+        return np.bincount(np.digitize(likes, [11, 51, 101]),
+                           minlength=4).astype(np.int64)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _ascii_metrics_kernel(buf: np.ndarray):
+        """Conta palavras, pontuação e maiúsculas em uma passada nativa."""
+        word_count = 0
+        punct = 0
+        upper = 0
+        prev_space = True
+        for i in range(buf.size):
+            byte = buf[i]
+            # Mesmo conjunto de separadores de str.split para ASCII
+            # (\t\n\v\f\r, \x1c-\x1f e espaço)
+            is_space = (9 <= byte <= 13) or (28 <= byte <= 32)
+            if prev_space and not is_space:
+                word_count += 1
+            prev_space = is_space
+            if 65 <= byte <= 90:
+                upper += 1
+            elif byte == 33 or byte == 44 or byte == 46 \
+                    or byte == 58 or byte == 59 or byte == 63:  # !,.:;?
+                punct += 1
+        return word_count, punct, upper
+
+    def ascii_text_metrics(data: bytes):
+        """Métricas de texto ASCII (palavras, pontuação, maiúsculas) fundidas."""
+        return _ascii_metrics_kernel(np.frombuffer(data, dtype=np.uint8))
+
+    @njit(cache=True)
+    def _ascii_run_kernel(buf: np.ndarray, limit: int) -> bool:
+        """Procura uma sequência de mais de limit bytes iguais consecutivos."""
+        run = 1
+        for i in range(1, buf.size):
+            if buf[i] == buf[i - 1]:
+                run += 1
+                if run > limit:
+                    return True
+            else:
+                run = 1
+        return False
+
+    def ascii_has_run(data: bytes, limit: int) -> bool:
+        """Detecta caracteres repetidos além do limite em texto ASCII."""
+        return _ascii_run_kernel(np.frombuffer(data, dtype=np.uint8), limit)
+else:
+    # Sem Numba não há versão que valha a pena: para comentários curtos
+    # as passadas str.translate/split (métricas) e o regex compilado
+    # (repetições) do chamador ganham do overhead de montar arrays NumPy
+    # por string — o chamador mantém esses caminhos.
+    ascii_text_metrics = None
+    ascii_has_run = None
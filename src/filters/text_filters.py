@@ -3,8 +3,15 @@ Filtros para processamento de texto.
 Cada filtro recebe um iterador e retorna um novo iterador com os dados processados.
 """
 
+import re
 from typing import Iterator
 
+# Checagem numérica em uma única passada: ao menos um dígito, e nada
+# além de dígitos e separadores (-, ., ,) — mesma semântica da cadeia
+# replace().replace().replace().isdigit(), sem as três strings
+# intermediárias por item
+_NUMERIC_RE = re.compile(r'^[-.,\d]*\d[-.,\d]*$')
+
 
 def remove_extra_spaces(data: Iterator[str]) -> Iterator[str]:
     """
@@ -39,7 +46,7 @@ def filter_numeric_strings(data: Iterator[str]) -> Iterator[str]:
     for item in data:
         if isinstance(item, str):
             # Verifica se a string representa um número (incluindo negativos)
-            if item.replace('-', '').replace('.', '').replace(',', '').isdigit():
+            if _NUMERIC_RE.match(item):
                 yield item
         else:
             # Se não for string, passa adiante sem modificação
@@ -88,3 +95,43 @@ def filter_greater_than(data: Iterator[int], threshold: int = 10) -> Iterator[in
         elif not isinstance(item, (int, float)):
             # Se não for número, passa adiante sem modificação
             yield item
+
+
+def fused_text_pipeline(data: Iterator[str], threshold: int = 10) -> Iterator[int]:
+    """
+    Versão fundida do pipeline padrão de processamento de texto.
+
+    Equivale ao encadeamento remove_extra_spaces ->
+    filter_numeric_strings -> convert_to_integers ->
+    filter_greater_than, mas em um único gerador: cada item paga um
+    só yield e uma só checagem de tipo, em vez de quatro.
+
+    Args:
+        data: Iterador de strings
+        threshold: Valor limite (padrão: 10)
+
+    Yields:
+        Inteiros convertidos e maiores que o limite
+    """
+    for item in data:
+        if isinstance(item, str):
+            # remove_extra_spaces
+            cleaned = ' '.join(item.split())
+            # filter_numeric_strings
+            if not _NUMERIC_RE.match(cleaned):
+                continue
+            # convert_to_integers
+            try:
+                number = int(float(cleaned.replace(',', '')))
+            except (ValueError, TypeError):
+                continue
+            # filter_greater_than
+            if number > threshold:
+                yield number
+        elif isinstance(item, (int, float)):
+            # Números passam direto pelos três primeiros filtros
+            if item > threshold:
+                yield item
+        else:
+            # Itens de outros tipos passam adiante sem modificação
+            yield item
@@ -2,9 +2,19 @@
 Pipeline específico para análise de comentários em redes sociais.
 """
 
+import multiprocessing
+import os
 from typing import Iterator, Dict, Any, List
 from .pipeline import Pipeline
 from filters.social_filters import (
+    coerce_dicts,
+    materialize,
+    _clean_item,
+    _engagement_item,
+    _spam_item,
+    _normalize_item,
+    _metrics_item,
+    _repeat_pattern,
     clean_text,
     filter_by_sentiment,
     filter_by_language,
@@ -15,10 +25,43 @@ from filters.social_filters import (
     normalize_user_names,
     add_text_metrics,
     get_top_users_by_comments,
-    get_user_engagement_summary
+    get_user_engagement_summary,
+    fused_enrich
 )
 
 
+# Pipeline compartilhado com os workers via fork (mesmo padrão de worker
+# de data/generator.py); os filtros de closure não precisam ser picklable
+_parallel_pipeline = None
+
+
+def _process_chunk(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Processa um lote de comentários no pipeline herdado pelo fork."""
+    return list(_parallel_pipeline.process(iter(chunk)))
+
+
+def _row_template(guard: str, call: str, inplace: bool) -> str:
+    """
+    Monta o trecho inlinável de um estágio por item (ver Pipeline.compile).
+
+    Itens que não passam no guarda são descartados, como nos geradores
+    correspondentes; sem inplace, o item é copiado antes da mutação.
+
+    Args:
+        guard: Expressão de guarda sobre a variável item
+        call: Chamada do núcleo por item
+        inplace: Se True, muta o item sem copiá-lo
+
+    Returns:
+        Trecho de código para _inline_template
+    """
+    lines = ['if not (%s):' % guard, '    continue']
+    if not inplace:
+        lines.append('item = item.copy()')
+    lines.append(call)
+    return '\n'.join(lines)
+
+
 class SocialCommentPipeline(Pipeline):
     """
     Pipeline especializado para análise de comentários em redes sociais.
@@ -28,16 +71,142 @@ class SocialCommentPipeline(Pipeline):
         """Inicializa o pipeline de comentários sociais."""
         super().__init__()
     
-    def add_text_cleaning(self) -> 'SocialCommentPipeline':
+    def process_parallel(self, comments: List[Dict[str, Any]],
+                         chunk_size: int = 10000,
+                         workers: int = None) -> Iterator[Dict[str, Any]]:
+        """
+        Processa os comentários em lotes paralelos, um processo por lote.
+
+        Útil quando os filtros são CPU-bound (regex/strings) e a lista é
+        grande: cada lote de chunk_size comentários atravessa o pipeline
+        em um worker. A ordem dos resultados é preservada. Só faz sentido
+        para filtros item a item; filtros de agregação (ex.: análise de
+        usuários top) veriam apenas o próprio lote.
+
+        Args:
+            comments: Lista de comentários (materializada, para fatiar)
+            chunk_size: Tamanho de cada lote
+            workers: Número de processos (padrão: um por lote, até o
+                número de CPUs)
+
+        Yields:
+            Comentários processados, na ordem original
+        """
+        if not isinstance(comments, list):
+            comments = list(comments)
+
+        try:
+            ctx = multiprocessing.get_context('fork')
+        except ValueError:
+            ctx = None
+
+        if ctx is None or len(comments) <= chunk_size:
+            # Lote único ou plataforma sem fork: caminho serial
+            yield from self.process(iter(comments))
+            return
+
+        chunks = [comments[i:i + chunk_size]
+                  for i in range(0, len(comments), chunk_size)]
+
+        global _parallel_pipeline
+        _parallel_pipeline = self
+        try:
+            processes = workers or min(len(chunks), os.cpu_count() or 1)
+            with ctx.Pool(processes=processes) as pool:
+                for processed in pool.imap(_process_chunk, chunks):
+                    yield from processed
+        finally:
+            _parallel_pipeline = None
+
+    def execute_parallel(self, data: Iterator[Dict[str, Any]],
+                         workers: int = None) -> List[Dict[str, Any]]:
+        """
+        Executa o pipeline em paralelo e retorna a lista completa.
+
+        Divide a entrada em um lote por worker (padrão: número de CPUs)
+        e processa cada lote em um processo via process_parallel —
+        escala quase linear para filtros CPU-bound item a item. Mesmas
+        ressalvas de process_parallel: filtros de agregação veriam
+        apenas o próprio lote.
+
+        Args:
+            data: Dados de entrada como iterador
+            workers: Número de processos (padrão: número de CPUs)
+
+        Returns:
+            Lista com os resultados processados, na ordem original
+        """
+        comments = data if isinstance(data, list) else list(data)
+        workers = workers or os.cpu_count() or 1
+        chunk_size = max(1, -(-len(comments) // workers))
+        return list(self.process_parallel(comments, chunk_size=chunk_size,
+                                          workers=workers))
+
+    def add_batch_filter(self, fn, batch_size: int = 256) -> 'SocialCommentPipeline':
+        """
+        Adiciona um filtro que processa os comentários em lotes.
+
+        Acumula batch_size itens e entrega a lista inteira a fn, que
+        devolve a lista (possivelmente filtrada/enriquecida) a emitir.
+        É o ponto de entrada para filtros vetorizados — as variantes
+        _batch deste repositório (add_engagement_score_batch,
+        detect_spam_batch) ou um classificador que só rende com lote
+        cheio — sem abrir mão do consumo lazy do pipeline: apenas um
+        lote fica em memória por vez.
+
+        Args:
+            fn: Função que recebe e retorna uma lista de comentários
+            batch_size: Tamanho de cada lote
+
+        Returns:
+            Self para permitir encadeamento de métodos
+        """
+        def batch_filter(data):
+            buffer = []
+            for item in data:
+                buffer.append(item)
+                if len(buffer) == batch_size:
+                    yield from fn(buffer)
+                    buffer = []
+            if buffer:
+                yield from fn(buffer)
+
+        self.add_filter(batch_filter)
+        return self
+
+    def add_coerce_dicts(self) -> 'SocialCommentPipeline':
+        """Adiciona a normalização de tipo de ingresso (ver coerce_dicts)."""
+        self.add_filter(coerce_dicts)
+        return self
+
+    def add_materialize(self) -> 'SocialCommentPipeline':
+        """Adiciona a cópia única de fronteira (ver materialize)."""
+        self.add_filter(materialize)
+        return self
+
+    def add_text_cleaning(self, inplace: bool = False) -> 'SocialCommentPipeline':
         """Adiciona filtros de limpeza de texto."""
-        self.add_filter(clean_text)
+        def clean_text_filter(data):
+            return clean_text(data, inplace)
+
+        # clean_text passa adiante itens sem texto em vez de descartá-los
+        clean_text_filter._inline_template = (
+            "if isinstance(item, dict) and 'text' in item:\n"
+            + ("" if inplace else "    item = item.copy()\n")
+            + "    _clean_item(item)")
+        clean_text_filter._inline_globals = {'_clean_item': _clean_item}
+        self.add_filter(clean_text_filter)
         return self
     
     def add_sentiment_filter(self, sentiment: str = "positive") -> 'SocialCommentPipeline':
         """Adiciona filtro por sentimento."""
         def filter_sentiment(data):
             return filter_by_sentiment(data, sentiment)
-        
+
+        filter_sentiment._inline_template = (
+            "if isinstance(item, dict) and item.get('sentiment') == %r:"
+            % sentiment)
+        filter_sentiment._predicate = True
         self.add_filter(filter_sentiment)
         return self
     
@@ -51,9 +220,17 @@ class SocialCommentPipeline(Pipeline):
     
     def add_country_filter(self, countries: List[str]) -> 'SocialCommentPipeline':
         """Adiciona filtro por países."""
+        # Congelado uma vez no registro: as execuções (e o caminho
+        # compilado) compartilham o mesmo conjunto, sem reconstruí-lo
+        countries = frozenset(countries)
+
         def filter_country(data):
             return filter_by_country(data, countries)
-        
+
+        filter_country._inline_template = (
+            "if isinstance(item, dict) and item.get('country') in _country_set:")
+        filter_country._inline_globals = {'_country_set': countries}
+        filter_country._predicate = True
         self.add_filter(filter_country)
         return self
     
@@ -61,31 +238,66 @@ class SocialCommentPipeline(Pipeline):
         """Adiciona filtro por faixa de likes."""
         def filter_likes(data):
             return filter_by_likes_threshold(data, min_likes, max_likes)
-        
+
+        filter_likes._inline_template = (
+            "if isinstance(item, dict) and 'likes' in item \\\n"
+            "        and item['likes'] >= _min_likes \\\n"
+            "        and (_max_likes is None or item['likes'] <= _max_likes):")
+        filter_likes._inline_globals = {'_min_likes': min_likes,
+                                        '_max_likes': max_likes}
+        filter_likes._predicate = True
         self.add_filter(filter_likes)
         return self
     
-    def add_engagement_analysis(self) -> 'SocialCommentPipeline':
+    def add_engagement_analysis(self, inplace: bool = False) -> 'SocialCommentPipeline':
         """Adiciona análise de engajamento."""
-        self.add_filter(add_engagement_score)
+        def engagement_filter(data):
+            return add_engagement_score(data, inplace)
+
+        engagement_filter._inline_template = _row_template(
+            "isinstance(item, dict)", "_engagement_item(item)", inplace)
+        engagement_filter._inline_globals = {'_engagement_item': _engagement_item}
+        self.add_filter(engagement_filter)
         return self
     
-    def add_spam_detection(self, max_repeated_chars: int = 3) -> 'SocialCommentPipeline':
+    def add_spam_detection(self, max_repeated_chars: int = 3, inplace: bool = False) -> 'SocialCommentPipeline':
         """Adiciona detecção de spam."""
         def detect_spam_filter(data):
-            return detect_spam(data, max_repeated_chars)
-        
+            return detect_spam(data, max_repeated_chars, inplace)
+
+        detect_spam_filter._inline_template = _row_template(
+            "isinstance(item, dict) and 'text' in item",
+            "_spam_item(item, _max_rc, _repeat_re)", inplace)
+        detect_spam_filter._inline_globals = {
+            '_spam_item': _spam_item,
+            '_max_rc': max_repeated_chars,
+            '_repeat_re': _repeat_pattern(max_repeated_chars)
+        }
         self.add_filter(detect_spam_filter)
         return self
     
-    def add_user_normalization(self) -> 'SocialCommentPipeline':
+    def add_user_normalization(self, inplace: bool = False) -> 'SocialCommentPipeline':
         """Adiciona normalização de nomes de usuário."""
-        self.add_filter(normalize_user_names)
+        def normalize_filter(data):
+            return normalize_user_names(data, inplace)
+
+        normalize_filter._inline_template = _row_template(
+            "isinstance(item, dict) and 'user' in item",
+            "_normalize_item(item)", inplace)
+        normalize_filter._inline_globals = {'_normalize_item': _normalize_item}
+        self.add_filter(normalize_filter)
         return self
     
-    def add_text_metrics(self) -> 'SocialCommentPipeline':
+    def add_text_metrics(self, inplace: bool = False) -> 'SocialCommentPipeline':
         """Adiciona métricas de texto."""
-        self.add_filter(add_text_metrics)
+        def text_metrics_filter(data):
+            return add_text_metrics(data, inplace)
+
+        text_metrics_filter._inline_template = _row_template(
+            "isinstance(item, dict) and 'text' in item",
+            "_metrics_item(item)", inplace)
+        text_metrics_filter._inline_globals = {'_metrics_item': _metrics_item}
+        self.add_filter(text_metrics_filter)
         return self
     
     def add_user_analysis(self, top_n: int = 10) -> 'SocialCommentPipeline':
@@ -112,10 +324,13 @@ def create_basic_social_pipeline() -> SocialCommentPipeline:
     Returns:
         Pipeline configurado com filtros básicos
     """
+    # Uma cópia na fronteira; os estágios seguintes mutam essa cópia
     return (SocialCommentPipeline()
-            .add_text_cleaning()
-            .add_user_normalization()
-            .add_text_metrics())
+            .add_coerce_dicts()
+            .add_materialize()
+            .add_text_cleaning(inplace=True)
+            .add_user_normalization(inplace=True)
+            .add_text_metrics(inplace=True))
 
 
 def create_user_analysis_pipeline(top_n: int = 10) -> SocialCommentPipeline:
@@ -129,8 +344,10 @@ def create_user_analysis_pipeline(top_n: int = 10) -> SocialCommentPipeline:
         Pipeline configurado para análise de usuários
     """
     return (SocialCommentPipeline()
-            .add_text_cleaning()
-            .add_user_normalization()
+            .add_coerce_dicts()
+            .add_materialize()
+            .add_text_cleaning(inplace=True)
+            .add_user_normalization(inplace=True)
             .add_user_analysis(top_n))
 
 
@@ -145,9 +362,11 @@ def create_user_engagement_pipeline(top_n: int = 10) -> SocialCommentPipeline:
         Pipeline configurado para análise de engajamento de usuários
     """
     return (SocialCommentPipeline()
-            .add_text_cleaning()
-            .add_user_normalization()
-            .add_engagement_analysis()
+            .add_coerce_dicts()
+            .add_materialize()
+            .add_text_cleaning(inplace=True)
+            .add_user_normalization(inplace=True)
+            .add_engagement_analysis(inplace=True)
             .add_user_engagement_analysis(top_n))
 
 
@@ -159,9 +378,11 @@ def create_sentiment_analysis_pipeline() -> SocialCommentPipeline:
         Pipeline configurado para análise de sentimentos
     """
     return (SocialCommentPipeline()
-            .add_text_cleaning()
-            .add_engagement_analysis()
-            .add_text_metrics())
+            .add_coerce_dicts()
+            .add_materialize()
+            .add_text_cleaning(inplace=True)
+            .add_engagement_analysis(inplace=True)
+            .add_text_metrics(inplace=True))
 
 
 def create_spam_detection_pipeline() -> SocialCommentPipeline:
@@ -172,9 +393,11 @@ def create_spam_detection_pipeline() -> SocialCommentPipeline:
         Pipeline configurado para detecção de spam
     """
     return (SocialCommentPipeline()
-            .add_text_cleaning()
-            .add_spam_detection()
-            .add_text_metrics())
+            .add_coerce_dicts()
+            .add_materialize()
+            .add_text_cleaning(inplace=True)
+            .add_spam_detection(inplace=True)
+            .add_text_metrics(inplace=True))
 
 
 def create_engagement_analysis_pipeline() -> SocialCommentPipeline:
@@ -185,10 +408,12 @@ def create_engagement_analysis_pipeline() -> SocialCommentPipeline:
         Pipeline configurado para análise de engajamento
     """
     return (SocialCommentPipeline()
-            .add_text_cleaning()
-            .add_engagement_analysis()
+            .add_coerce_dicts()
+            .add_materialize()
+            .add_text_cleaning(inplace=True)
+            .add_engagement_analysis(inplace=True)
             .add_likes_filter(min_likes=10)
-            .add_text_metrics())
+            .add_text_metrics(inplace=True))
 
 
 def create_multilingual_pipeline(languages: List[str]) -> SocialCommentPipeline:
@@ -201,7 +426,7 @@ def create_multilingual_pipeline(languages: List[str]) -> SocialCommentPipeline:
     Returns:
         Pipeline configurado para análise multilingue
     """
-    pipeline = SocialCommentPipeline().add_text_cleaning()
+    pipeline = SocialCommentPipeline().add_coerce_dicts().add_text_cleaning()
     
     # Adiciona filtros para cada idioma
     for language in languages:
@@ -221,10 +446,12 @@ def create_geographic_pipeline(countries: List[str]) -> SocialCommentPipeline:
         Pipeline configurado para análise geográfica
     """
     return (SocialCommentPipeline()
-            .add_text_cleaning()
+            .add_coerce_dicts()
+            .add_materialize()
+            .add_text_cleaning(inplace=True)
             .add_country_filter(countries)
-            .add_user_normalization()
-            .add_text_metrics())
+            .add_user_normalization(inplace=True)
+            .add_text_metrics(inplace=True))
 
 
 def create_comprehensive_social_pipeline() -> SocialCommentPipeline:
@@ -234,9 +461,7 @@ def create_comprehensive_social_pipeline() -> SocialCommentPipeline:
     Returns:
         Pipeline configurado com todos os filtros principais
     """
-    return (SocialCommentPipeline()
-            .add_text_cleaning()
-            .add_user_normalization()
-            .add_engagement_analysis()
-            .add_spam_detection()
-            .add_text_metrics())
+    # Filtro fundido: mesma semântica do encadeamento completo
+    # (limpeza + normalização + engajamento + spam + métricas), com uma
+    # única cópia de dicionário por comentário
+    return SocialCommentPipeline().add_coerce_dicts().add_filter(fused_enrich)
@@ -1,23 +1,45 @@
 #!/usr/bin/env python3
 """
 Análise rápida dos comentários sociais.
-Script leve para estatísticas básicas sem dependências pesadas.
+Script leve para estatísticas básicas (apenas NumPy; sem pandas/matplotlib).
 """
 
+import io
 import json
 import sys
 import os
+from collections import Counter
 from pathlib import Path
 
+import numpy as np
+
+# orjson é opcional: decodifica os bytes UTF-8 direto em C, bem mais
+# rápido que o parser puro-Python do json para datasets de vários MB
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# datasketch é opcional: o HyperLogLog estima usuários únicos com ~2KB
+# de memória, em vez do set exato cujo hash table cresce com a
+# cardinalidade (a linha de pico de RSS deste script em datasets grandes)
+try:
+    from datasketch import HyperLogLog
+except ImportError:
+    HyperLogLog = None
+
 # Adiciona o diretório src ao path
 sys.path.insert(0, os.path.dirname(__file__))
 
+from _fastpaths import bucket_likes
+
 
 def load_data(data_path: str = "data/comments_dataset.json"):
     """Carrega os dados dos comentários."""
     try:
-        with open(data_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(data_path, 'rb') as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
     except FileNotFoundError:
         print(f"❌ Arquivo não encontrado: {data_path}")
         print("💡 Execute 'make generate-data' primeiro")
@@ -30,70 +52,73 @@ def quick_analysis(comments):
         return
     
     total = len(comments)
-    positive = sum(1 for c in comments if c['sentiment'] == 'positive')
+
+    # Colunas NumPy montadas uma única vez: cada redução vira um loop C
+    # sobre um array contíguo, em vez de uma passada Python por métrica
+    likes = np.fromiter((c['likes'] for c in comments),
+                        dtype=np.int32, count=total)
+    positive = int(np.fromiter((c['sentiment'] == 'positive' for c in comments),
+                               dtype=bool, count=total).sum())
     negative = total - positive
-    
-    # Estatísticas de likes
-    likes = [c['likes'] for c in comments]
-    avg_likes = sum(likes) / len(likes)
-    max_likes = max(likes)
-    min_likes = min(likes)
-    
-    # Países únicos
-    countries = set(c['country'] for c in comments)
-    users = set(c['user'] for c in comments)
-    
+
+    # Estatísticas de likes: reduções C encadeadas sobre o mesmo array
+    # (que também alimenta bucket_likes adiante) — o array fica quente
+    # no cache em vez de três passadas Python sobre a lista
+    avg_likes = likes.mean()
+    max_likes = int(likes.max())
+
+    # Contagens por país (uma passada; serve os únicos e o top 5 —
+    # cardinalidade pequena, então o Counter exato fica)
+    country_counts = Counter(c['country'] for c in comments)
+
+    # Usuários únicos: campo de alta cardinalidade — estimado por HLL
+    # quando disponível, exato via set caso contrário
+    if HyperLogLog is not None:
+        hll_users = HyperLogLog(p=12)
+        for c in comments:
+            hll_users.update(c['user'].encode())
+        unique_users = int(len(hll_users))
+    else:
+        unique_users = len(set(c['user'] for c in comments))
+
     # Comprimento médio do texto
-    text_lengths = [len(c['text']) for c in comments]
-    avg_text_length = sum(text_lengths) / len(text_lengths)
-    
-    print("\n" + "="*60)
-    print("📊 ANÁLISE RÁPIDA - COMENTÁRIOS SOCIAIS")
-    print("="*60)
-    print(f"📝 Total de comentários: {total:,}")
-    print(f"😊 Comentários positivos: {positive:,} ({positive/total*100:.1f}%)")
-    print(f"😞 Comentários negativos: {negative:,} ({negative/total*100:.1f}%)")
-    print(f"👍 Média de likes: {avg_likes:.1f}")
-    print(f"🔥 Máximo de likes: {max_likes:,}")
-    print(f"🌍 Países únicos: {len(countries)}")
-    print(f"👥 Usuários únicos: {len(users)}")
-    print(f"📏 Comprimento médio do texto: {avg_text_length:.1f} caracteres")
+    avg_text_length = np.fromiter((len(c['text']) for c in comments),
+                                  dtype=np.int64, count=total).mean()
     
-    # Top 5 países
-    country_counts = {}
-    for c in comments:
-        country = c['country']
-        country_counts[country] = country_counts.get(country, 0) + 1
+    # Relatório montado em um buffer e emitido em uma única escrita,
+    # em vez de uma chamada de print (lock + flush) por linha
+    buf = io.StringIO()
+    w = buf.write
+    w("\n" + "="*60 + "\n")
+    w("📊 ANÁLISE RÁPIDA - COMENTÁRIOS SOCIAIS\n")
+    w("="*60 + "\n")
+    w(f"📝 Total de comentários: {total:,}\n")
+    w(f"😊 Comentários positivos: {positive:,} ({positive/total*100:.1f}%)\n")
+    w(f"😞 Comentários negativos: {negative:,} ({negative/total*100:.1f}%)\n")
+    w(f"👍 Média de likes: {avg_likes:.1f}\n")
+    w(f"🔥 Máximo de likes: {max_likes:,}\n")
+    w(f"🌍 Países únicos: {len(country_counts)}\n")
+    w(f"👥 Usuários únicos: {unique_users}\n")
+    w(f"📏 Comprimento médio do texto: {avg_text_length:.1f} caracteres\n")
     
-    top_countries = sorted(country_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-    print(f"\n🌍 Top 5 países:")
+    # Top 5 países (seleção parcial do Counter, sem ordenar tudo)
+    top_countries = country_counts.most_common(5)
+    w(f"\n🌍 Top 5 países:\n")
     for i, (country, count) in enumerate(top_countries, 1):
-        print(f"   {i}. {country}: {count:,} comentários")
-    
-    # Distribuição de likes por faixa
-    like_ranges = {
-        "0-10": 0,
-        "11-50": 0,
-        "51-100": 0,
-        "100+": 0
-    }
+        w(f"   {i}. {country}: {count:,} comentários\n")
     
-    for like in likes:
-        if like <= 10:
-            like_ranges["0-10"] += 1
-        elif like <= 50:
-            like_ranges["11-50"] += 1
-        elif like <= 100:
-            like_ranges["51-100"] += 1
-        else:
-            like_ranges["100+"] += 1
+    # Distribuição de likes por faixa: loop nativo (Numba) ou
+    # bucketização vetorizada, conforme o que estiver disponível
+    like_ranges = dict(zip(["0-10", "11-50", "51-100", "100+"],
+                           bucket_likes(likes).tolist()))
     
-    print(f"\n👍 Distribuição de likes:")
+    w(f"\n👍 Distribuição de likes:\n")
     for range_name, count in like_ranges.items():
         percentage = (count / total) * 100
-        print(f"   {range_name}: {count:,} ({percentage:.1f}%)")
+        w(f"   {range_name}: {count:,} ({percentage:.1f}%)\n")
     
-    print("="*60)
+    w("="*60 + "\n")
+    sys.stdout.write(buf.getvalue())
 
 
 def main():
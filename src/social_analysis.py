@@ -2,14 +2,39 @@
 Análise de comentários em redes sociais usando a arquitetura Pipes and Filters.
 """
 
+import io
 import json
 import sys
 import os
-from typing import List, Dict, Any
+from collections import Counter
+from heapq import nlargest
+from typing import Iterator, List, Dict, Any
+
+import pandas as pd
+
+# Decodificadores opcionais: orjson para carga completa rápida, ijson
+# para streaming com memória limitada pelo item corrente
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# pyahocorasick é opcional: um autômato DFA em C varre o texto uma única
+# vez procurando todas as palavras-chave de todos os idiomas
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 # Adiciona o diretório atual ao path para imports
 sys.path.insert(0, os.path.dirname(__file__))
 
+from filters.social_filters import group_by_language
 from pipes.social_pipeline import (
     create_basic_social_pipeline,
     create_sentiment_analysis_pipeline,
@@ -21,6 +46,56 @@ from pipes.social_pipeline import (
 )
 
 
+# Palavras-chave por idioma do detector de spam da demonstração
+# abrangente, na ordem de prioridade do encadeamento if/elif original
+# (casamento por substring, sem fronteira de palavra)
+_SPAM_LANG_KEYWORDS = {
+    'portuguese': ['não', 'muito', 'bom', 'ruim'],
+    'english': ['the', 'and', 'very', 'good', 'bad'],
+    'spanish': ['el', 'la', 'muy', 'bueno', 'malo'],
+    'french': ['le', 'la', 'très', 'bon', 'mauvais'],
+    'german': ['der', 'die', 'sehr', 'gut', 'schlecht'],
+}
+
+if ahocorasick is not None:
+    # Autômato construído uma vez no import: todas as palavras-chave de
+    # todos os idiomas em um único DFA
+    _SPAM_LANG_AUTOMATON = ahocorasick.Automaton()
+    for _lang, _words in _SPAM_LANG_KEYWORDS.items():
+        for _word in _words:
+            _SPAM_LANG_AUTOMATON.add_word(_word, _lang)
+    _SPAM_LANG_AUTOMATON.make_automaton()
+else:
+    _SPAM_LANG_AUTOMATON = None
+
+
+def _detect_spam_language(text: str) -> str:
+    """
+    Detecta o idioma de um comentário spam pelas palavras-chave.
+
+    Com pyahocorasick, uma única passada linear pelo texto coleta os
+    idiomas casados e a ordem de prioridade original desempata; sem
+    ele, cai nas cinco varreduras sequenciais equivalentes.
+
+    Args:
+        text: Texto do comentário (já em minúsculas)
+
+    Returns:
+        Nome do idioma ou 'unknown'
+    """
+    if _SPAM_LANG_AUTOMATON is not None:
+        matched = {lang for _, lang in _SPAM_LANG_AUTOMATON.iter(text)}
+        for lang in _SPAM_LANG_KEYWORDS:
+            if lang in matched:
+                return lang
+        return 'unknown'
+
+    for lang, words in _SPAM_LANG_KEYWORDS.items():
+        if any(word in text for word in words):
+            return lang
+    return 'unknown'
+
+
 def load_comments_from_json(filename: str) -> List[Dict[str, Any]]:
     """
     Carrega comentários de um arquivo JSON.
@@ -32,63 +107,94 @@ def load_comments_from_json(filename: str) -> List[Dict[str, Any]]:
         Lista de comentários
     """
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(filename, 'rb') as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
     except FileNotFoundError:
         print(f"❌ Arquivo {filename} não encontrado!")
         print("💡 Execute primeiro: python data/generator.py")
         return []
-    except json.JSONDecodeError:
+    except ValueError:
         print(f"❌ Erro ao decodificar o arquivo {filename}")
         return []
 
 
+def iter_comments(filename: str) -> Iterator[Dict[str, Any]]:
+    """
+    Itera os comentários de um arquivo JSON de forma lazy.
+
+    Com ijson instalado, os registros são decodificados um a um
+    conforme o pipeline consome — a lista completa nunca é montada em
+    memória. Sem ijson, cai na carga completa de load_comments_from_json
+    e itera sobre ela.
+
+    Args:
+        filename: Nome do arquivo JSON (array de comentários)
+
+    Yields:
+        Dicionários de comentários, na ordem do arquivo
+    """
+    if ijson is not None:
+        with open(filename, 'rb') as f:
+            yield from ijson.items(f, 'item')
+    else:
+        yield from load_comments_from_json(filename)
+
+
 def print_comment_summary(comments: List[Dict[str, Any]], title: str):
     """Imprime um resumo dos comentários processados."""
-    print(f"\n{'='*60}")
-    print(f"📊 {title}")
-    print(f"{'='*60}")
+    # Resumo montado em um buffer e emitido em uma única escrita, em
+    # vez de uma chamada de print (lock + flush) por linha
+    buf = io.StringIO()
+    w = buf.write
+    w(f"\n{'='*60}\n")
+    w(f"📊 {title}\n")
+    w(f"{'='*60}\n")
     
     if not comments:
-        print("❌ Nenhum comentário encontrado.")
+        w("❌ Nenhum comentário encontrado.\n")
+        sys.stdout.write(buf.getvalue())
         return
     
-    print(f"📝 Total de comentários: {len(comments)}")
+    w(f"📝 Total de comentários: {len(comments)}\n")
+    
+    # Colunas contíguas para as reduções: um loop C por estatística em
+    # vez de um gerador Python por comentário
+    df = pd.DataFrame(comments)
     
     # Estatísticas básicas
-    if comments and 'sentiment' in comments[0]:
-        positive_count = sum(1 for c in comments if c.get('sentiment') == 'positive')
-        negative_count = sum(1 for c in comments if c.get('sentiment') == 'negative')
-        print(f"😊 Positivos: {positive_count}")
-        print(f"😞 Negativos: {negative_count}")
+    if 'sentiment' in df.columns:
+        positive_count = int(df['sentiment'].eq('positive').sum())
+        negative_count = int(df['sentiment'].eq('negative').sum())
+        w(f"😊 Positivos: {positive_count}\n")
+        w(f"😞 Negativos: {negative_count}\n")
     
     # Estatísticas de likes
-    if comments and 'likes' in comments[0]:
-        likes = [c.get('likes', 0) for c in comments]
-        avg_likes = sum(likes) / len(likes)
-        max_likes = max(likes)
-        print(f"👍 Média de likes: {avg_likes:.1f}")
-        print(f"🔥 Máximo de likes: {max_likes}")
-    
-    # Estatísticas de países
-    if comments and 'country' in comments[0]:
-        countries = {}
-        for comment in comments:
-            country = comment.get('country', 'Desconhecido')
-            countries[country] = countries.get(country, 0) + 1
+    if 'likes' in df.columns:
+        likes = df['likes'].fillna(0)
+        w(f"👍 Média de likes: {likes.mean():.1f}\n")
+        w(f"🔥 Máximo de likes: {int(likes.max())}\n")
+    
+    # Estatísticas de países (Counter preserva o desempate por ordem de
+    # primeira aparição do sorted estável original)
+    if 'country' in df.columns:
+        countries = Counter(c.get('country', 'Desconhecido') for c in comments)
         
-        print(f"🌍 Países: {len(countries)}")
-        top_countries = sorted(countries.items(), key=lambda x: x[1], reverse=True)[:3]
-        print("   Top 3 países:")
-        for country, count in top_countries:
-            print(f"     {country}: {count}")
+        w(f"🌍 Países: {len(countries)}\n")
+        w("   Top 3 países:\n")
+        for country, count in countries.most_common(3):
+            w(f"     {country}: {count}\n")
     
     # Mostra alguns exemplos
-    print(f"\n📋 Exemplos de comentários:")
+    w(f"\n📋 Exemplos de comentários:\n")
     for i, comment in enumerate(comments[:3]):
-        print(f"   {i+1}. {comment.get('user', 'N/A')} ({comment.get('country', 'N/A')}):")
-        print(f"      \"{comment.get('text', 'N/A')[:80]}{'...' if len(comment.get('text', '')) > 80 else ''}\"")
-        print(f"      Likes: {comment.get('likes', 0)}, Sentimento: {comment.get('sentiment', 'N/A')}")
+        # Uma busca por chave, reaproveitada nas duas pontas do f-string
+        text = comment.get('text', 'N/A')
+        w(f"   {i+1}. {comment.get('user', 'N/A')} ({comment.get('country', 'N/A')}):\n")
+        w(f"      \"{text[:80]}{'...' if len(text) > 80 else ''}\"\n")
+        w(f"      Likes: {comment.get('likes', 0)}, Sentimento: {comment.get('sentiment', 'N/A')}\n")
+    
+    sys.stdout.write(buf.getvalue())
 
 
 def demonstrate_basic_pipeline(comments: List[Dict[str, Any]]):
@@ -97,7 +203,7 @@ def demonstrate_basic_pipeline(comments: List[Dict[str, Any]]):
     print("=" * 60)
     
     pipeline = create_basic_social_pipeline()
-    result = pipeline.execute(iter(comments))
+    result = pipeline.execute(comments)
     
     print_comment_summary(result, "Pipeline Básico - Limpeza e Normalização")
     
@@ -120,11 +226,11 @@ def demonstrate_sentiment_analysis(comments: List[Dict[str, Any]]):
     
     # Pipeline para comentários positivos
     positive_pipeline = create_sentiment_analysis_pipeline().add_sentiment_filter("positive")
-    positive_comments = positive_pipeline.execute(iter(comments))
+    positive_comments = positive_pipeline.execute(comments)
     
     # Pipeline para comentários negativos
     negative_pipeline = create_sentiment_analysis_pipeline().add_sentiment_filter("negative")
-    negative_comments = negative_pipeline.execute(iter(comments))
+    negative_comments = negative_pipeline.execute(comments)
     
     print_comment_summary(positive_comments, "Comentários Positivos")
     print_comment_summary(negative_comments, "Comentários Negativos")
@@ -146,7 +252,7 @@ def demonstrate_spam_detection(comments: List[Dict[str, Any]]):
     print("=" * 60)
     
     pipeline = create_spam_detection_pipeline()
-    result = pipeline.execute(iter(comments))
+    result = pipeline.execute(comments)
     
     # Separa comentários normais e spam
     normal_comments = [c for c in result if not c.get('is_spam', False)]
@@ -158,10 +264,9 @@ def demonstrate_spam_detection(comments: List[Dict[str, Any]]):
     # Mostra razões do spam
     if spam_comments:
         print(f"\n🚨 Razões para detecção de spam:")
-        spam_reasons = {}
-        for comment in spam_comments:
-            for reason in comment.get('spam_reason', []):
-                spam_reasons[reason] = spam_reasons.get(reason, 0) + 1
+        # Acumulação inteira em C, sem o get(k, 0) + 1 por linha
+        spam_reasons = Counter(reason for comment in spam_comments
+                               for reason in comment.get('spam_reason', []))
         
         for reason, count in spam_reasons.items():
             print(f"   {reason}: {count} comentários")
@@ -173,52 +278,70 @@ def demonstrate_engagement_analysis(comments: List[Dict[str, Any]]):
     print("=" * 60)
     
     pipeline = create_engagement_analysis_pipeline()
-    result = pipeline.execute(iter(comments))
+    result = pipeline.execute(comments)
     
     print_comment_summary(result, "Análise de Engajamento (likes >= 10)")
     
     # Top comentários por engajamento
     if result:
-        top_engagement = sorted(result, key=lambda x: x.get('engagement_score', 0), reverse=True)[:5]
+        # Seleção parcial: O(n log 5) em vez de ordenar todos os comentários
+        top_engagement = nlargest(5, result, key=lambda x: x.get('engagement_score', 0))
         
         print(f"\n🏆 Top 5 comentários por engajamento:")
         for i, comment in enumerate(top_engagement):
             score = comment.get('engagement_score', 0)
             likes = comment.get('likes', 0)
             sentiment = comment.get('sentiment', 'N/A')
+            text = comment.get('text', 'N/A')
             print(f"   {i+1}. Score: {score:.2f} | Likes: {likes} | Sentimento: {sentiment}")
-            print(f"      \"{comment.get('text', 'N/A')[:60]}{'...' if len(comment.get('text', '')) > 60 else ''}\"")
+            print(f"      \"{text[:60]}{'...' if len(text) > 60 else ''}\"")
+
 
+def demonstrate_multilingual_analysis(cleaned_comments: List[Dict[str, Any]]):
+    """Demonstra a análise multilingue.
 
-def demonstrate_multilingual_analysis(comments: List[Dict[str, Any]]):
-    """Demonstra a análise multilingue."""
+    Recebe a materialização limpa/normalizada compartilhada (ver main):
+    só o predicado de idioma roda por língua, em vez de um pipeline
+    completo varrer todos os comentários de novo a cada idioma.
+    """
     print("\n🚀 Demonstração: Análise Multilingue")
     print("=" * 60)
     
     languages = ["portuguese", "english", "spanish", "french", "german"]
     
+    # Uma única passada tokeniza cada texto uma vez e classifica contra
+    # os cinco vocabulários, em vez de cinco varreduras completas
+    by_language = group_by_language(cleaned_comments, languages)
+    
     for language in languages:
-        pipeline = create_multilingual_pipeline([language])
-        result = pipeline.execute(iter(comments))
+        result = by_language[language]
         
         if result:
             print(f"\n🌐 {language.capitalize()}: {len(result)} comentários")
-            # Mostra exemplo
-            example = result[0]
-            print(f"   Exemplo: \"{example.get('text', 'N/A')[:50]}{'...' if len(example.get('text', '')) > 50 else ''}\"")
+            # Mostra exemplo (uma busca por chave, usada nas duas pontas)
+            text = result[0].get('text', 'N/A')
+            print(f"   Exemplo: \"{text[:50]}{'...' if len(text) > 50 else ''}\"")
 
 
-def demonstrate_geographic_analysis(comments: List[Dict[str, Any]]):
-    """Demonstra a análise geográfica."""
+def demonstrate_geographic_analysis(cleaned_comments: List[Dict[str, Any]]):
+    """Demonstra a análise geográfica.
+
+    Como na análise multilingue, aplica apenas o predicado de país
+    sobre a materialização limpa compartilhada.
+    """
     print("\n🚀 Demonstração: Análise Geográfica")
     print("=" * 60)
     
-    # Análise para países específicos
+    # Análise para países específicos, agrupados em uma única passada
     target_countries = ["Brasil", "Estados Unidos", "França"]
+    by_country = {country: [] for country in target_countries}
+    for comment in cleaned_comments:
+        groups = by_country.get(comment.get('country'))
+        if groups is not None:
+            groups.append(comment)
     
     for country in target_countries:
-        pipeline = create_geographic_pipeline([country])
-        result = pipeline.execute(iter(comments))
+        result = by_country[country]
         
         if result:
             print(f"\n🌍 {country}: {len(result)} comentários")
@@ -234,7 +357,7 @@ def demonstrate_comprehensive_pipeline(comments: List[Dict[str, Any]]):
     print("=" * 60)
     
     pipeline = create_comprehensive_social_pipeline()
-    result = pipeline.execute(iter(comments))
+    result = pipeline.execute(comments)
     
     print_comment_summary(result, "Pipeline Abrangente - Todos os Filtros")
     
@@ -242,40 +365,21 @@ def demonstrate_comprehensive_pipeline(comments: List[Dict[str, Any]]):
     if result:
         print(f"\n📊 Estatísticas Avançadas:")
         
-        # Engajamento por país
-        engagement_by_country = {}
-        for comment in result:
-            country = comment.get('country', 'Desconhecido')
-            score = comment.get('engagement_score', 0)
-            if country not in engagement_by_country:
-                engagement_by_country[country] = []
-            engagement_by_country[country].append(score)
+        # Engajamento por país: groupby colunar em vez do loop de
+        # append em dicionário (o groupby já sai ordenado por país)
+        df_result = pd.DataFrame(result)
+        engagement_by_country = (df_result
+                                 .groupby('country')['engagement_score']
+                                 .mean())
         
         print(f"   Engajamento médio por país:")
-        for country, scores in sorted(engagement_by_country.items()):
-            avg_score = sum(scores) / len(scores)
+        for country, avg_score in engagement_by_country.items():
             print(f"     {country}: {avg_score:.2f}")
         
-        # Spam por idioma
-        spam_by_language = {}
-        for comment in result:
-            if comment.get('is_spam', False):
-                # Detecta idioma baseado no texto
-                text = comment.get('text', '').lower()
-                if any(word in text for word in ['não', 'muito', 'bom', 'ruim']):
-                    lang = 'portuguese'
-                elif any(word in text for word in ['the', 'and', 'very', 'good', 'bad']):
-                    lang = 'english'
-                elif any(word in text for word in ['el', 'la', 'muy', 'bueno', 'malo']):
-                    lang = 'spanish'
-                elif any(word in text for word in ['le', 'la', 'très', 'bon', 'mauvais']):
-                    lang = 'french'
-                elif any(word in text for word in ['der', 'die', 'sehr', 'gut', 'schlecht']):
-                    lang = 'german'
-                else:
-                    lang = 'unknown'
-                
-                spam_by_language[lang] = spam_by_language.get(lang, 0) + 1
+        # Spam por idioma (uma passada por texto; ver _detect_spam_language)
+        spam_by_language = Counter(
+            _detect_spam_language(comment.get('text', '').lower())
+            for comment in result if comment.get('is_spam', False))
         
         if spam_by_language:
             print(f"   Spam por idioma:")
@@ -298,13 +402,18 @@ def main():
     
     print(f"✅ Carregados {len(comments)} comentários de {data_file}")
     
+    # Materialização limpa/normalizada compartilhada: as análises por
+    # idioma e por país aplicam só o próprio predicado sobre ela, em vez
+    # de repetir a limpeza de todos os comentários a cada variação
+    cleaned = create_basic_social_pipeline().execute(comments)
+    
     # Demonstrações
     demonstrate_basic_pipeline(comments)
     demonstrate_sentiment_analysis(comments)
     demonstrate_spam_detection(comments)
     demonstrate_engagement_analysis(comments)
-    demonstrate_multilingual_analysis(comments)
-    demonstrate_geographic_analysis(comments)
+    demonstrate_multilingual_analysis(cleaned)
+    demonstrate_geographic_analysis(cleaned)
     demonstrate_comprehensive_pipeline(comments)
     
     print(f"\n🎉 Análise completa finalizada!")
@@ -188,6 +188,23 @@ class TestSocialFilters(unittest.TestCase):
         
         self.assertTrue(spam_detected)
     
+    def test_detect_spam_repeated_chars_threshold(self):
+        """Testa o limite de caracteres repetidos consecutivos."""
+        # Exatamente no limite (3 repetições): não é spam
+        at_limit = {"user": "Test User", "text": "Bom demais!!! recomendo a todos"}
+        # Acima do limite (4 repetições): spam
+        over_limit = {"user": "Test User", "text": "Bom demais!!!! recomendo a todos"}
+
+        result = list(detect_spam(iter([at_limit, over_limit])))
+
+        self.assertFalse(result[0]["is_spam"])
+        self.assertTrue(result[1]["is_spam"])
+        self.assertIn("repeated_chars", result[1]["spam_reason"])
+
+        # Limite customizado mais permissivo
+        result = list(detect_spam(iter([over_limit]), max_repeated_chars=4))
+        self.assertFalse(result[0]["is_spam"])
+
     def test_normalize_user_names(self):
         """Testa normalização de nomes de usuário."""
         result = list(normalize_user_names(iter(self.sample_comments)))